@@ -1,16 +1,20 @@
-from flask import Flask, render_template, send_from_directory
+from flask import Flask, render_template
 import os
 
 # ---------------------
 # Basic Flask Setup
 # ---------------------
-template_dir = os.path.abspath("templates")
-static_dir = os.path.abspath("static")
+# Resolve folders from this file, not the working directory, so the app
+# finds its assets no matter where gunicorn/waitress is launched from.
+base_dir = os.path.dirname(os.path.abspath(__file__))
+template_dir = os.path.join(base_dir, "templates")
+static_dir = os.path.join(base_dir, "static")
 
 app = Flask(__name__, template_folder=template_dir, static_folder=static_dir)
 
-# Disable caching so changes appear instantly
-app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
+# Let browsers reuse CSS/JS/video for an hour instead of revalidating the
+# background video and stylesheets on every page view
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 3600
 
 # ---------------------
 # Public Website Pages
@@ -46,13 +50,14 @@ def terms():
 # ---------------------
 # Static Files
 # ---------------------
-@app.route("/static/<path:filename>")
-def serve_static(filename):
-    return send_from_directory(static_dir, filename)
+# Served by Flask's built-in "static" endpoint (static_folder above), which
+# already handles /static/<path:filename> with ETag and Range support.
 
 # ---------------------
 # Run App
 # ---------------------
 if __name__ == "__main__":
+    # Disable caching so changes appear instantly while developing
+    app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 0
     print("Running static website server on http://127.0.0.1:5000")
     app.run(debug=True, port=5000)